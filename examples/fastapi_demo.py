@@ -3,7 +3,7 @@
 This application demonstrates how to build a documentation site using
 Pysty components. It uses the ``DefaultCard`` and ``DefaultButton``
 components defined in the ``pysty`` package. Sections are composed
-dynamically and rendered into a simple HTML shell.
+dynamically and streamed inside a simple HTML shell.
 
 Run this app with ``uvicorn fastapi_demo:app --reload`` and visit
 ``http://localhost:8000/`` to view the documentation.
@@ -12,10 +12,11 @@ Run this app with ``uvicorn fastapi_demo:app --reload`` and visit
 from __future__ import annotations
 
 import random
-from typing import Callable
+from typing import Iterable, Iterator
 
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
+from jinja2 import DictLoader, Environment, select_autoescape
 
 import pysty as ps
 
@@ -24,15 +25,9 @@ app = FastAPI()
 
 
 # --------------------------------------------------------------------
-# Page wrapper
+# Templates
 # --------------------------------------------------------------------
-def page(content: str) -> str:
-    """Wrap the given content in a basic HTML layout.
-
-    The page includes TailwindCSS and HTMX via CDN. Content is
-    inserted inside a centered container with some padding.
-    """
-    return f"""
+PAGE_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -44,12 +39,51 @@ def page(content: str) -> str:
     </head>
     <body class="bg-gray-50 text-gray-900">
         <div class="max-w-6xl mx-auto px-6 py-16">
-            {content}
+            {% for section in sections %}{{ section|safe }}{% endfor %}
         </div>
     </body>
     </html>
     """
 
+SECTION_TEMPLATE = """
+    <section class="mb-24">
+        <h2 class="text-3xl font-bold mb-2">{{ title }}</h2>
+        <p class="text-gray-600 mb-8 max-w-3xl">{{ description }}</p>
+        <div class="bg-white border border-gray-200 rounded-xl p-10 mb-8">
+            {{ preview|safe }}
+        </div>
+        <pre class="bg-slate-900 text-slate-100 text-sm rounded-xl p-6 overflow-x-auto">
+{{ code }}
+        </pre>
+    </section>
+    """
+
+# Compiled once; auto_reload=False skips the per-lookup freshness check
+ENV = Environment(
+    loader=DictLoader(
+        {"page.html": PAGE_TEMPLATE, "section.html": SECTION_TEMPLATE}
+    ),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+)
+PAGE = ENV.get_template("page.html")
+SECTION = ENV.get_template("section.html")
+
+
+# --------------------------------------------------------------------
+# Page wrapper
+# --------------------------------------------------------------------
+def page_stream(sections: Iterable[str]) -> Iterator[str]:
+    """Stream a basic HTML layout around the given sections.
+
+    The page includes TailwindCSS and HTMX via CDN. The head is sent
+    before any section is consumed, so the browser can start fetching
+    those scripts; each section is then sent in turn inside a centered
+    container with some padding. Pass a generator to render sections
+    lazily.
+    """
+    return PAGE.generate(sections=sections)
+
 
 # --------------------------------------------------------------------
 # Documentation section helper
@@ -59,54 +93,49 @@ def doc_section(title: str, description: str, preview: str, code: str) -> str:
 
     Each section consists of a heading, a description, a preview of the
     rendered component(s), and the source code used to create the preview.
+    ``preview`` is inserted as HTML; everything else is escaped.
     """
-    return f"""
-    <section class="mb-24">
-        <h2 class="text-3xl font-bold mb-2">{title}</h2>
-        <p class="text-gray-600 mb-8 max-w-3xl">{description}</p>
-        <div class="bg-white border border-gray-200 rounded-xl p-10 mb-8">
-            {preview}
-        </div>
-        <pre class="bg-slate-900 text-slate-100 text-sm rounded-xl p-6 overflow-x-auto">
-{code}
-        </pre>
-    </section>
-    """
+    return SECTION.render(
+        title=title, description=description, preview=preview, code=code
+    )
 
 
 # --------------------------------------------------------------------
 # Home route
 # --------------------------------------------------------------------
-@app.get("/", response_class=HTMLResponse)
-def home() -> HTMLResponse:
-    """Render the home page with documentation sections."""
-    content = (
-        """
+@app.get("/")
+async def home() -> StreamingResponse:
+    """Stream the home page with documentation sections."""
+    return StreamingResponse(
+        page_stream([intro_section(), _CARDS_HTML, _BUTTONS_HTML]),
+        media_type="text/html",
+    )
+
+
+def intro_section() -> str:
+    """Page heading and tagline."""
+    return """
         <h1 class="text-4xl font-bold text-center mb-3">Pysty Components</h1>
         <p class="text-gray-600 text-center mb-20 max-w-2xl mx-auto">
             A Python-first UI component system built around explicit configuration,
             strong typing, and composable server-driven interaction.
         </p>
         """
-        + cards_section()
-        + button_section()
-    )
-    return HTMLResponse(page(content))
 
 
 # --------------------------------------------------------------------
 # Section: Cards
 # --------------------------------------------------------------------
-def cards_section() -> str:
+def _build_cards_section() -> str:
     """Demonstrate static and interactive cards."""
     # Static card
-    static_card = ps.DefaultCard(
+    static_card = ps.DefaultCard.build(
         title="Static Card",
         content="A simple card with a title and description.",
     ).render()
 
     # Interactive card that refreshes on click
-    interactive_card = ps.DefaultCard(
+    interactive_card = ps.DefaultCard.build(
         title="Interactive Card",
         content="Click this card to refresh.",
         hx_get="/card/refresh",
@@ -138,39 +167,44 @@ def cards_section() -> str:
     )
 
 
-# Endpoint to refresh the interactive card
+# Endpoint to refresh the interactive card.
+# Only the number changes between responses, so the card is rendered once
+# with a placeholder that each request substitutes.
+_REFRESH_TEMPLATE = ps.DefaultCard.build(
+    title="Updated!",
+    content="Random value: __V__",
+    hx_get="/card/refresh",
+    hx_trigger="click",
+    hx_swap="outerHTML",
+).render()
+
+
 @app.get("/card/refresh", response_class=HTMLResponse)
 def refresh_card() -> str:
     """Return a card with a random value to demonstrate interactivity."""
-    return ps.DefaultCard(
-        title="Updated!",
-        content=f"Random value: {random.randint(1, 100)}",
-        hx_get="/card/refresh",
-        hx_trigger="click",
-        hx_swap="outerHTML",
-    ).render()
+    return _REFRESH_TEMPLATE.replace("__V__", str(random.randint(1, 100)))
 
 
 # --------------------------------------------------------------------
 # Section: Buttons
 # --------------------------------------------------------------------
-def button_section() -> str:
+def _build_button_section() -> str:
     """Showcase buttons with preset variants and custom classes."""
     preview = f"""
     <div class="flex flex-wrap gap-3 mb-6">
-        {ps.DefaultButton(label="Default").render()}
-        {ps.DefaultButton(label="Success", variant="success").render()}
-        {ps.DefaultButton(label="Warning", variant="warning").render()}
+        {ps.DefaultButton.build(label="Default").render()}
+        {ps.DefaultButton.build(label="Success", variant="success").render()}
+        {ps.DefaultButton.build(label="Warning", variant="warning").render()}
 
-        {ps.DefaultButton(label="Danger", variant="danger").render()}
-        {ps.DefaultButton(label="Ghost", variant="ghost").render()}
+        {ps.DefaultButton.build(label="Danger", variant="danger").render()}
+        {ps.DefaultButton.build(label="Ghost", variant="ghost").render()}
     </div>
     <div class="flex flex-wrap gap-3">
-        {ps.DefaultButton(
+        {ps.DefaultButton.build(
             label="Gradient",
             variant="bg-gradient-to-r from-purple-500 to-pink-500 text-white hover:opacity-90",
         ).render()}
-        {ps.DefaultButton(
+        {ps.DefaultButton.build(
             label="Outline",
             variant="bg-transparent border-2 border-blue-600 text-blue-600 hover:bg-blue-600 hover:text-white",
         ).render()}
@@ -191,3 +225,8 @@ ps.DefaultButton(
         preview,
         code,
     )
+
+
+# Static previews never change: render them once at import time
+_CARDS_HTML = _build_cards_section()
+_BUTTONS_HTML = _build_button_section()
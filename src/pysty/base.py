@@ -1,12 +1,107 @@
-from abc import ABC, abstractmethod
+from functools import lru_cache
+from html import escape
 from typing import Any, ClassVar
-from pydantic import BaseModel, Field
+from pydantic.fields import Field
+from pydantic.main import BaseModel
+from typing_extensions import Self
 
+_object_setattr = object.__setattr__
+
+@lru_cache(maxsize=None)
 def _to_html_attr(name: str) -> str:
     """Convert Python attr name to HTML: hx_swap_oob → hx-swap-oob, class_ → class"""
     return name.rstrip("_").replace("_", "-")
 
-class Component(BaseModel, ABC):
+def _collect_htmx_metadata(cls: Any) -> None:
+    """Cache a component class' hx_* → HTML name map (declaration order) and its non-None defaults.
+
+    Inherited objects are kept when unchanged, so subclasses that add or
+    redefine no hx_* fields share them.
+    """
+    html_names = {
+        name: _to_html_attr(name)
+        for name in cls.model_fields
+        if name.startswith("hx_")
+    }
+    if list(html_names) != list(cls._htmx_html_names):
+        cls._htmx_html_names = html_names
+    defaulted = frozenset(
+        name
+        for name in html_names
+        if (field := cls.model_fields[name]).default is not None
+        or field.default_factory is not None
+    )
+    if defaulted != cls._htmx_defaulted:
+        cls._htmx_defaulted = defaulted
+
+# Dominate's attribute-name shorthands
+_ATTR_SHORTHANDS = {
+    "cls": "class",
+    "className": "class",
+    "class_name": "class",
+    "klass": "class",
+    "fr": "for",
+    "html_for": "for",
+    "htmlFor": "for",
+    "phor": "for",
+}
+
+@lru_cache(maxsize=None)
+def _html_attr_name(name: str) -> str:
+    """Normalize attribute names like Dominate: cls/class_ → class, _for → for, aria_label → aria-label, xlink_href → xlink:href"""
+    name = _ATTR_SHORTHANDS.get(name, name).strip("_")
+    if name.split("_")[0] in ("xlink", "xml", "xmlns"):
+        return name.replace("_", ":", 1)
+    return name.replace("_", "-")
+
+def _is_immutable(value: Any) -> bool:
+    """True for scalar defaults (and tuples/frozensets of them) that are safe to share between instances."""
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return value is None or isinstance(value, (str, bytes, int, float, complex))
+
+def _fast_build_defaults(cls: Any) -> dict[str, Any] | None:
+    """Field-ordered values template for the ``build()`` fast path, or None if the class must use model_construct().
+
+    Required fields hold a None placeholder so merged kwargs keep field
+    order. model_construct() is needed for default factories, aliases,
+    mutable defaults, extra fields, private attributes and post-init hooks.
+    """
+    if (
+        cls.__private_attributes__
+        or cls.__pydantic_post_init__
+        or cls.model_config.get("extra") == "allow"
+    ):
+        return None
+    defaults = {}
+    for name, field in cls.model_fields.items():
+        if field.alias is not None or field.validation_alias is not None:
+            return None
+        if field.is_required():
+            defaults[name] = None
+            continue
+        if field.default_factory is not None or not _is_immutable(field.default):
+            return None
+        defaults[name] = field.default
+    return defaults
+
+def _render_attrs(attrs: dict[str, Any]) -> str:
+    """Serialize attributes as ` name="value"` pairs (values escaped), ready to follow a tag name.
+
+    Like Dominate, ``None``/``False`` values are omitted and ``True`` renders
+    as a boolean attribute (``disabled="disabled"``).
+    """
+    parts = []
+    for name, value in attrs.items():
+        if value is None or value is False:
+            continue
+        name = _html_attr_name(name)
+        if value is True:
+            value = name
+        parts.append(f' {name}="{escape(str(value))}"')
+    return "".join(parts)
+
+class Component(BaseModel):
     """
     Base class for all Pysty UI components.
     """
@@ -65,22 +160,69 @@ class Component(BaseModel, ABC):
     # HTMX event handling
     hx_on: str | None = Field(default=None)
 
-    # Internal – cache HTMX field names for performance
-    _htmx_field_names: ClassVar[tuple[str, ...]] = ()
+    # Internal – HTMX field name → HTML attribute name, in declaration order
+    _htmx_html_names: ClassVar[dict[str, str]] = {}
+
+    # Internal – hx_* fields with a non-None default, emitted even when not set
+    _htmx_defaulted: ClassVar[frozenset[str]] = frozenset()
+
+    # Internal – static field defaults for the ``build()`` fast path;
+    # None when the class needs model_construct() (see _fast_build_defaults)
+    _defaults: ClassVar[dict[str, Any] | None] = None
 
-    def __init_subclass__(cls, **kwargs: Any) -> None:
-        """Cache HTMX field names when subclass is created (runs once per class)."""
-        super().__init_subclass__(**kwargs)
-        cls._htmx_field_names = tuple(
-            name for name in cls.model_fields if name.startswith("hx_")
+    # Internal – required field names, which ``build()`` must receive for the fast path
+    _required: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache field metadata once the subclass' fields are complete (runs once per class)."""
+        super().__pydantic_init_subclass__(**kwargs)
+        # model_fields is complete here, including hx_* fields from mixins
+        _collect_htmx_metadata(cls)
+        cls._defaults = _fast_build_defaults(cls)
+        cls._required = frozenset(
+            name for name, field in cls.model_fields.items() if field.is_required()
         )
 
+    @classmethod
+    def build(cls, **kwargs: Any) -> Self:
+        """Create a component from trusted kwargs, skipping validation.
+
+        Intended for programmer-supplied literals on hot render paths.
+        Use the regular constructor for untrusted input.
+        """
+        defaults = cls._defaults
+        if defaults is None or not kwargs.keys() >= cls._required:
+            return cls.model_construct(**kwargs)
+        # Merging into the field-ordered template keeps model_fields order
+        values = {**defaults, **kwargs}
+        if len(values) != len(defaults):  # unknown keys: let model_construct() drop them
+            return cls.model_construct(**kwargs)
+        # Same end state as model_construct(), minus its per-field default loop
+        component = cls.__new__(cls)
+        _object_setattr(component, "__dict__", values)
+        _object_setattr(component, "__pydantic_fields_set__", set(kwargs))
+        _object_setattr(component, "__pydantic_extra__", None)
+        _object_setattr(component, "__pydantic_private__", None)
+        return component
+
     def _htmx_attributes(self) -> dict[str, str]:
-        """Collect non-None HTMX attributes as HTML-ready dict."""
+        """Collect non-None HTMX attributes as HTML-ready dict.
+
+        Only explicitly set fields, plus fields with a non-None default, can
+        be non-None, so components with neither return without touching
+        any field.
+        """
+        fields_set = self.__pydantic_fields_set__
+        html_names = self._htmx_html_names
+        defaulted = self._htmx_defaulted
+        if not defaulted and fields_set.isdisjoint(html_names):
+            return {}
         return {
-            _to_html_attr(name): str(value)
-            for name in self._htmx_field_names
-            if (value := getattr(self, name, None)) is not None
+            html_name: str(value)
+            for name, html_name in html_names.items()
+            if (name in fields_set or name in defaulted)
+            and (value := getattr(self, name)) is not None
         }
 
     def html_attributes(self) -> dict[str, Any]:
@@ -88,10 +230,24 @@ class Component(BaseModel, ABC):
         return {}
 
     def _combined_attributes(self) -> dict[str, Any]:
-        """Merge HTMX + custom HTML attributes for Dominate rendering."""
+        """Merge HTMX + custom HTML attributes for rendering."""
         return {**self._htmx_attributes(), **self.html_attributes()}
 
-    @abstractmethod
     def render(self) -> str:
-        """Return HTML string. Typically: return div(...).render()"""
-        ...
+        """Return HTML string.
+
+        Typically an f-string: ``f"<div{_render_attrs(self._combined_attributes())}>...</div>"``,
+        escaping user text with ``html.escape``. Dominate remains available
+        for a ``render_dom()`` fallback.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement render()"
+        )
+
+    def __html__(self) -> str:
+        """HTML protocol used by markupsafe/Jinja2: embed rendered output without re-escaping."""
+        return self.render()
+
+
+# Computed once; shared by every subclass whose hx_* fields are unchanged
+_collect_htmx_metadata(Component)
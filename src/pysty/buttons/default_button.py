@@ -1,8 +1,11 @@
+import sys
+from html import escape
 from typing import ClassVar, Union, Literal
-from pydantic import Field
+from pydantic.fields import Field
+from pydantic.functional_validators import field_validator
 from dominate.tags import button
 
-from pysty.base import Component
+from pysty.base import Component, _render_attrs
 
 # IDE-only presets (not runtime enums)
 ButtonSize = Literal["xs", "sm", "md", "lg", "xl"]
@@ -17,6 +20,54 @@ ButtonVariant = Literal[
     "ghost",
 ]
 
+# Internal preset maps
+_SIZE_MAP: dict[str, str] = {
+    "xs": "text-xs px-2 py-1",
+    "sm": "text-xs px-3 py-1.5",
+    "md": "text-sm px-4 py-2.5",
+    "lg": "text-base px-5 py-3",
+    "xl": "text-lg px-6 py-4",
+}
+
+_VARIANT_MAP: dict[str, str] = {
+    "default": (
+        "text-white bg-blue-600 border border-transparent "
+        "hover:bg-blue-700 focus:ring-4 focus:ring-blue-300"
+    ),
+    "secondary": (
+        "text-gray-700 bg-gray-200 border border-gray-300 "
+        "hover:bg-gray-300 hover:text-gray-900 focus:ring-4 focus:ring-gray-100"
+    ),
+    "tertiary": (
+        "text-gray-600 bg-gray-100 border border-gray-200 "
+        "hover:bg-gray-200 hover:text-gray-900 focus:ring-4 focus:ring-gray-100"
+    ),
+    "success": (
+        "text-white bg-green-600 border border-transparent "
+        "hover:bg-green-700 focus:ring-4 focus:ring-green-300"
+    ),
+    "danger": (
+        "text-white bg-red-600 border border-transparent "
+        "hover:bg-red-700 focus:ring-4 focus:ring-red-300"
+    ),
+    "warning": (
+        "text-white bg-yellow-500 border border-transparent "
+        "hover:bg-yellow-600 focus:ring-4 focus:ring-yellow-300"
+    ),
+    "dark": (
+        "text-white bg-gray-800 border border-transparent "
+        "hover:bg-gray-900 focus:ring-4 focus:ring-gray-500"
+    ),
+    "ghost": (
+        "text-gray-700 bg-transparent border border-transparent "
+        "hover:bg-gray-100 focus:ring-4 focus:ring-gray-200"
+    ),
+}
+
+# Intern preset keys and class strings once, at import
+_SIZE_MAP = {sys.intern(k): sys.intern(v) for k, v in _SIZE_MAP.items()}
+_VARIANT_MAP = {sys.intern(k): sys.intern(v) for k, v in _VARIANT_MAP.items()}
+
 # Small, explicit resolver
 def resolve(value: str, mapping: dict[str, str]) -> str:
     """
@@ -35,56 +86,16 @@ class DefaultButton(Component):
     - Explicit, predictable behavior
     """
 
-    # Internal preset maps
-    _SIZE_MAP = {
-        "xs": "text-xs px-2 py-1",
-        "sm": "text-xs px-3 py-1.5",
-        "md": "text-sm px-4 py-2.5",
-        "lg": "text-base px-5 py-3",
-        "xl": "text-lg px-6 py-4",
-    }
-
-    _VARIANT_MAP = {
-        "default": (
-            "text-white bg-blue-600 border border-transparent "
-            "hover:bg-blue-700 focus:ring-4 focus:ring-blue-300"
-        ),
-        "secondary": (
-            "text-gray-700 bg-gray-200 border border-gray-300 "
-            "hover:bg-gray-300 hover:text-gray-900 focus:ring-4 focus:ring-gray-100"
-        ),
-        "tertiary": (
-            "text-gray-600 bg-gray-100 border border-gray-200 "
-            "hover:bg-gray-200 hover:text-gray-900 focus:ring-4 focus:ring-gray-100"
-        ),
-        "success": (
-            "text-white bg-green-600 border border-transparent "
-            "hover:bg-green-700 focus:ring-4 focus:ring-green-300"
-        ),
-        "danger": (
-            "text-white bg-red-600 border border-transparent "
-            "hover:bg-red-700 focus:ring-4 focus:ring-red-300"
-        ),
-        "warning": (
-            "text-white bg-yellow-500 border border-transparent "
-            "hover:bg-yellow-600 focus:ring-4 focus:ring-yellow-300"
-        ),
-        "dark": (
-            "text-white bg-gray-800 border border-transparent "
-            "hover:bg-gray-900 focus:ring-4 focus:ring-gray-500"
-        ),
-        "ghost": (
-            "text-gray-700 bg-transparent border border-transparent "
-            "hover:bg-gray-100 focus:ring-4 focus:ring-gray-200"
-        ),
-    }
-
     # Base classes
-    BASE_CLASSES: ClassVar[str] = (
+    BASE_CLASSES: ClassVar[str] = sys.intern(
         "box-border font-medium leading-5 rounded-lg shadow-sm "
         "focus:outline-none transition-colors"
     )
 
+    # Composed class strings for every preset (size, variant) pair.
+    # Keyed on BASE_CLASSES too, so subclasses overriding it never hit a stale entry.
+    _CLASS_CACHE: ClassVar[dict[tuple[str, str, str], str]] = {}
+
     # Public API (user facing)
     label: str = Field(...)
     size: Union[ButtonSize, str] = Field(
@@ -104,17 +115,43 @@ class DefaultButton(Component):
         description="HTML button type.",
     )
 
+    @field_validator("size", "variant")
+    @classmethod
+    def _intern_preset(cls, value: str) -> str:
+        """Intern size/variant so equal values share one string (and hit _CLASS_CACHE by identity)."""
+        return sys.intern(value)
+
     # Rendering
     def html_attributes(self) -> dict:
-        size_cls = resolve(self.size, self._SIZE_MAP)
-        variant_cls = resolve(self.variant, self._VARIANT_MAP)
+        cls_str = self._CLASS_CACHE.get(
+            (self.BASE_CLASSES, self.size, self.variant)
+        ) or (
+            f"{self.BASE_CLASSES} {resolve(self.size, _SIZE_MAP)} "
+            f"{resolve(self.variant, _VARIANT_MAP)}"
+        )
         return {
-            "class": f"{self.BASE_CLASSES} {size_cls} {variant_cls}",
+            "class": cls_str,
             "type": self.type,
         }
 
     def render(self) -> str:
+        return (
+            f"<button{_render_attrs(self._combined_attributes())}>"
+            f"{escape(self.label)}</button>"
+        )
+
+    def render_dom(self) -> str:
+        """Render through a Dominate tag tree (the pre-f-string renderer)."""
         return button(
             self.label,
             **self._combined_attributes()
         ).render()
+
+
+DefaultButton._CLASS_CACHE = {
+    (DefaultButton.BASE_CLASSES, size, variant): sys.intern(
+        f"{DefaultButton.BASE_CLASSES} {size_cls} {variant_cls}"
+    )
+    for size, size_cls in _SIZE_MAP.items()
+    for variant, variant_cls in _VARIANT_MAP.items()
+}
@@ -1,9 +1,11 @@
-from typing import Union, List
-from pydantic import Field
+from html import escape
+from operator import attrgetter
+from typing import Any, ClassVar, Union, List
+from pydantic.fields import Field
 from dominate.tags import div, h5, p
 from dominate.util import raw 
 
-from pysty.base import Component
+from pysty.base import Component, _render_attrs
 
 class DefaultCard(Component):
     """
@@ -41,7 +43,7 @@ class DefaultCard(Component):
     )
 
     # Internal
-    _style_fields = [
+    _style_fields: ClassVar[tuple[str, ...]] = (
         "display",
         "width",
         "padding",
@@ -52,32 +54,82 @@ class DefaultCard(Component):
         "hover_shadow",
         "hover_background",
         "transitions",
-    ]
+    )
+
+    # Fetches every style field in one C-level call; rebuilt per subclass
+    _style_getter: ClassVar[attrgetter]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Rebuild the style getter so subclasses can extend ``_style_fields``."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._style_getter = attrgetter(*cls._style_fields)
 
     # Rendering
     def render(self) -> str:
         attrs = self._combined_attributes()
-        data = self.model_dump()
-        attrs["class"] = " ".join(data[field] for field in self._style_fields)
+        attrs["class"] = " ".join(self._style_getter(self))
+
+        out = [
+            "<div",
+            _render_attrs(attrs),
+            ">",
+            f'<h5 class="{escape(self.title_classes)}">{escape(self.title)}</h5>',
+        ]
+
+        # Safe composition
+        if isinstance(self.content, str):
+            out.append(
+                f'<p class="{escape(self.content_classes)}">'
+                f"{escape(self.content)}</p>"
+            )
+        elif isinstance(self.content, Component):
+            out.append(self.content.render())
+        elif isinstance(self.content, (list, tuple)):
+            for item in self.content:
+                if not isinstance(item, Component):
+                    raise TypeError(
+                        "All items in content list must be Pysty Components"
+                    )
+                out.append(item.render())
+        else:
+            raise TypeError(
+                "content must be str, Component, or list[Component]"
+            )
+
+        out.append("</div>")
+        return "".join(out)
+
+    def render_dom(self) -> str:
+        """Render through a Dominate tag tree (the pre-f-string renderer)."""
+        attrs = self._combined_attributes()
+        attrs["class"] = " ".join(self._style_getter(self))
+
+        # Safe composition. Child components are rendered up front, outside
+        # the card's Dominate context, and added as a single raw node.
+        children = None
+        if isinstance(self.content, Component):
+            children = self.content.render()
+        elif isinstance(self.content, (list, tuple)):
+            for item in self.content:
+                if not isinstance(item, Component):
+                    raise TypeError(
+                        "All items in content list must be Pysty Components"
+                    )
+            children = "".join([item.render() for item in self.content])
+        elif not isinstance(self.content, str):
+            raise TypeError(
+                "content must be str, Component, or list[Component]"
+            )
 
         with div(**attrs) as card:
             h5(self.title, cls=self.title_classes)
-
-            # Safe composition
-            if isinstance(self.content, str):
+            if children is None:
                 p(self.content, cls=self.content_classes)
-            elif isinstance(self.content, Component):
-                card.add(raw(self.content.render()))
-            elif isinstance(self.content, (list, tuple)):
-                for item in self.content:
-                    if not isinstance(item, Component):
-                        raise TypeError(
-                            "All items in content list must be Pysty Components"
-                        )
-                    card.add(raw(item.render()))
             else:
-                raise TypeError(
-                    "content must be str, Component, or list[Component]"
-                )
+                raw(children)
 
         return card.render()
+
+
+DefaultCard._style_getter = attrgetter(*DefaultCard._style_fields)
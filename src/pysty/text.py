@@ -1,7 +1,9 @@
 # pysty/text.py
-from pydantic import Field
+from html import escape
+
+from pydantic.fields import Field
 from dominate.tags import p
-from pysty.base import Component
+from pysty.base import Component, _render_attrs
 
 
 class Text(Component):
@@ -23,4 +25,8 @@ class Text(Component):
         return {"class": self.classes}
 
     def render(self) -> str:
+        return f"<p{_render_attrs(self._combined_attributes())}>{escape(self.value)}</p>"
+
+    def render_dom(self) -> str:
+        """Render through a Dominate tag tree (the pre-f-string renderer)."""
         return p(self.value, **self._combined_attributes()).render()
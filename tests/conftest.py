@@ -0,0 +1,32 @@
+from html.parser import HTMLParser
+
+import pytest
+
+
+class _Structure(HTMLParser):
+    """Flatten markup into (event, tag/text, sorted attrs), ignoring whitespace and attribute order."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[tuple] = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("start", tag, tuple(sorted(attrs))))
+
+    def handle_endtag(self, tag):
+        self.events.append(("end", tag))
+
+    def handle_data(self, data):
+        if data.strip():
+            self.events.append(("text", data.strip()))
+
+
+@pytest.fixture
+def structure():
+    def parse(markup: str) -> list[tuple]:
+        parser = _Structure()
+        parser.feed(markup)
+        parser.close()
+        return parser.events
+
+    return parse
@@ -0,0 +1,185 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+import pysty as ps
+from pysty.base import Component
+from pysty.text import Text
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs",
+    [
+        (ps.DefaultCard, dict(title="Hello", content="World", hx_get="/x")),
+        (ps.DefaultButton, dict(label="x", variant="ghost")),
+        (Text, dict(value="hi", classes="text-sm")),
+    ],
+)
+def test_build_matches_validated_constructor(cls, kwargs):
+    built = cls.build(**kwargs)
+    validated = cls(**kwargs)
+    assert built == validated
+    assert built.model_dump_json() == validated.model_dump_json()
+    assert repr(built) == repr(validated)
+    assert built.render() == validated.render()
+
+
+def test_build_drops_unknown_keys():
+    button = ps.DefaultButton.build(label="x", lable="y")
+    assert "lable" not in button.__dict__
+    assert button.model_fields_set == {"label"}
+    assert button.model_dump_json() == ps.DefaultButton(label="x").model_dump_json()
+
+
+def test_build_without_required_field_matches_model_construct():
+    built = ps.DefaultButton.build(variant="ghost")
+    assert "label" not in built.__dict__
+    assert built.__dict__ == ps.DefaultButton.model_construct(variant="ghost").__dict__
+
+
+def test_build_fields_set_only_contains_passed_keys():
+    card = ps.DefaultCard.build(title="t", content="c", hx_get="/x")
+    assert card.model_fields_set == {"title", "content", "hx_get"}
+
+
+def test_build_fills_defaults():
+    button = ps.DefaultButton.build(label="Go")
+    assert button.size == "md"
+    assert button.variant == "default"
+    assert button.type == "button"
+    assert button.hx_get is None
+
+
+def test_build_skips_validation():
+    # Trusted path: no coercion or type checks
+    text = Text.build(value=123)
+    assert text.value == 123
+
+
+class ClickCard(ps.DefaultCard):
+    hx_trigger: Optional[str] = "click"
+
+
+def test_htmx_attributes_skip_unset_fields():
+    assert ps.DefaultButton(label="x")._htmx_attributes() == {}
+    assert ps.DefaultButton(label="x", hx_get=None)._htmx_attributes() == {}
+
+
+def test_htmx_attributes_keep_declaration_order():
+    card = ps.DefaultCard(title="t", content="c", hx_swap="outerHTML", hx_get="/x")
+    assert list(card._htmx_attributes()) == ["hx-get", "hx-swap"]
+
+
+def test_htmx_attributes_include_non_none_defaults():
+    expected = {"hx-trigger": "click"}
+    assert ClickCard(title="t", content="c")._htmx_attributes() == expected
+    assert ClickCard.build(title="t", content="c")._htmx_attributes() == expected
+    assert 'hx-trigger="click"' in ClickCard(title="t", content="c").render()
+
+
+def test_htmx_attributes_default_can_be_cleared():
+    card = ClickCard(title="t", content="c", hx_trigger=None)
+    assert card._htmx_attributes() == {}
+
+
+def test_htmx_metadata_is_shared_unless_subclass_declares_hx_fields():
+    assert ps.DefaultCard._htmx_html_names is Component._htmx_html_names
+    assert ps.DefaultButton._htmx_html_names is Component._htmx_html_names
+
+    class Extra(ps.DefaultButton):
+        hx_foo_bar: Optional[str] = None
+
+    class ExtraChild(Extra):
+        pass
+
+    assert Extra._htmx_html_names["hx_foo_bar"] == "hx-foo-bar"
+    assert ExtraChild._htmx_html_names is Extra._htmx_html_names
+    assert 'hx-foo-bar="1"' in Extra(label="x", hx_foo_bar="1").render()
+
+
+def test_redeclared_hx_default_is_picked_up_by_subclass_of_subclass():
+    class Child(ClickCard):
+        pass
+
+    assert Child._htmx_defaulted == {"hx_trigger"}
+    assert ps.DefaultCard._htmx_defaulted == frozenset()
+
+
+class Listing(Component):
+    items: list = Field(default_factory=list)
+
+    def render(self) -> str:
+        return f"<ul>{len(self.items)}</ul>"
+
+
+class Tagged(Component):
+    tags: list = []
+
+    def render(self) -> str:
+        return f"<span>{self.tags}</span>"
+
+
+class Aliased(Component):
+    css: str = Field("x", alias="class")
+
+    def render(self) -> str:
+        return f"<i>{self.css}</i>"
+
+
+def test_build_calls_default_factories():
+    assert Listing.build().items == []
+    assert Listing.build().render() == "<ul>0</ul>"
+
+
+def test_build_does_not_share_mutable_defaults():
+    Tagged.build().tags.append(1)
+    assert Tagged.build().tags == []
+    assert Tagged().tags == []
+
+
+def test_build_maps_aliases():
+    built = Aliased.build(**{"class": "y"})
+    assert built.css == "y"
+    assert built.model_fields_set == {"css"}
+
+
+def test_build_uses_fast_path_only_for_static_immutable_defaults():
+    assert ps.DefaultCard._defaults is not None
+    assert ps.DefaultButton._defaults is not None
+    assert Listing._defaults is None
+    assert Tagged._defaults is None
+    assert Aliased._defaults is None
+
+
+def test_html_protocol_returns_render_output():
+    button = ps.DefaultButton(label="<x>")
+    assert button.__html__() == button.render()
+
+
+def test_markupsafe_does_not_reescape_components():
+    markupsafe = pytest.importorskip("markupsafe")
+    button = ps.DefaultButton(label="<x>")
+    assert str(markupsafe.escape(button)) == button.render()
+    assert str(markupsafe.escape("<x>")) == "&lt;x&gt;"
+
+
+def test_parent_card_reflects_child_changes():
+    child = ps.DefaultButton(label="A")
+    card = ps.DefaultCard(title="t", content=[child])
+    assert ">A</button>" in card.render()
+    child.label = "B"
+    assert ">B</button>" in child.render()
+    assert ">B</button>" in card.render()
+
+
+class HxMixin(BaseModel):
+    hx_foo: Optional[str] = None
+
+
+def test_hx_fields_from_non_component_mixin_are_rendered():
+    class Mixed(HxMixin, ps.DefaultButton):
+        pass
+
+    assert 'hx-foo="1"' in Mixed(label="a", hx_foo="1").render()
+    assert 'hx-foo="1"' in Mixed.build(label="a", hx_foo="1").render()
@@ -0,0 +1,68 @@
+import pysty as ps
+from pysty.buttons.default_button import _SIZE_MAP, _VARIANT_MAP
+
+
+def _classes(button: ps.DefaultButton) -> str:
+    return button.html_attributes()["class"]
+
+
+def test_preset_classes_come_from_cache():
+    button = ps.DefaultButton(label="Go", size="sm", variant="success")
+    expected = ps.DefaultButton._CLASS_CACHE[
+        (ps.DefaultButton.BASE_CLASSES, "sm", "success")
+    ]
+    assert _classes(button) is expected
+    assert _classes(button) == (
+        f"{ps.DefaultButton.BASE_CLASSES} {_SIZE_MAP['sm']} {_VARIANT_MAP['success']}"
+    )
+
+
+def test_custom_variant_falls_back_to_raw_classes():
+    button = ps.DefaultButton(label="Go", variant="bg-pink-500 text-white")
+    assert _classes(button) == (
+        f"{ps.DefaultButton.BASE_CLASSES} {_SIZE_MAP['md']} bg-pink-500 text-white"
+    )
+
+
+def test_custom_size_falls_back_to_raw_classes():
+    button = ps.DefaultButton(label="Go", size="px-9")
+    assert _classes(button) == (
+        f"{ps.DefaultButton.BASE_CLASSES} px-9 {_VARIANT_MAP['default']}"
+    )
+
+
+def test_subclass_base_classes_override_is_respected():
+    class Flat(ps.DefaultButton):
+        BASE_CLASSES = "flat"
+
+    assert _classes(Flat(label="Go")) == (
+        f"flat {_SIZE_MAP['md']} {_VARIANT_MAP['default']}"
+    )
+
+
+def test_render_escapes_label():
+    assert ps.DefaultButton(label="<i>&").render().endswith(">&lt;i&gt;&amp;</button>")
+
+
+def test_render_matches_render_dom(structure):
+    button = ps.DefaultButton(
+        label='Save "now"', variant="bg-x", type="submit", hx_post="/save"
+    )
+    assert structure(button.render()) == structure(button.render_dom())
+
+
+def test_render_normalizes_subclass_attributes_like_render_dom(structure):
+    class Toggle(ps.DefaultButton):
+        def html_attributes(self) -> dict:
+            return {
+                **super().html_attributes(),
+                "aria_pressed": "true",
+                "disabled": False,
+                "autofocus": True,
+            }
+
+    button = Toggle(label="On")
+    assert structure(button.render()) == structure(button.render_dom())
+    assert 'aria-pressed="true"' in button.render()
+    assert 'autofocus="autofocus"' in button.render()
+    assert "disabled" not in button.render()
@@ -0,0 +1,62 @@
+import pytest
+
+import pysty as ps
+from pysty.text import Text
+
+
+def test_render_escapes_title_and_text_content():
+    card = ps.DefaultCard(title="A & B", content="<script>")
+    rendered = card.render()
+    assert "<h5" in rendered and ">A &amp; B</h5>" in rendered
+    assert ">&lt;script&gt;</p>" in rendered
+    assert "<script>" not in rendered
+
+
+def test_render_includes_htmx_attributes():
+    card = ps.DefaultCard(
+        title="t", content="c", hx_get="/card/refresh", hx_swap="outerHTML"
+    )
+    assert card.render().startswith(
+        '<div hx-get="/card/refresh" hx-swap="outerHTML" class="block max-w-sm'
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "plain <text>",
+        Text(value="child"),
+        [Text(value="first"), ps.DefaultButton(label="second")],
+    ],
+)
+def test_render_matches_render_dom(structure, content):
+    card = ps.DefaultCard(title="Title", content=content, hx_get="/x")
+    assert structure(card.render()) == structure(card.render_dom())
+
+
+def test_list_children_render_once_in_order():
+    card = ps.DefaultCard(
+        title="t", content=[Text(value="one"), Text(value="two")]
+    )
+    rendered = card.render()
+    assert rendered.count("one") == 1
+    assert rendered.index("</h5>") < rendered.index("one") < rendered.index("two")
+
+
+def test_render_rejects_non_component_list_items():
+    card = ps.DefaultCard.build(title="t", content=["nope"])
+    with pytest.raises(TypeError):
+        card.render()
+    with pytest.raises(TypeError):
+        card.render_dom()
+
+
+def test_subclass_can_extend_style_fields():
+    class SpacedCard(ps.DefaultCard):
+        margin: str = "m-4"
+        _style_fields = (*ps.DefaultCard._style_fields, "margin")
+
+    card = SpacedCard(title="t", content="c")
+    assert 'transition-all duration-150 m-4"' in card.render()
+    assert 'transition-all duration-150 m-4"' in card.render_dom()
+    assert "m-4" not in ps.DefaultCard(title="t", content="c").render()
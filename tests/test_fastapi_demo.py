@@ -0,0 +1,46 @@
+import re
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("jinja2")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import fastapi_demo  # noqa: E402
+import pysty as ps  # noqa: E402
+
+client = TestClient(fastapi_demo.app)
+
+
+def test_refresh_card_substitutes_random_value():
+    response = client.get("/card/refresh")
+    assert response.status_code == 200
+    assert "__V__" not in response.text
+
+    value = int(re.search(r"Random value: (\d+)", response.text).group(1))
+    assert 1 <= value <= 100
+    assert response.text == ps.DefaultCard(
+        title="Updated!",
+        content=f"Random value: {value}",
+        hx_get="/card/refresh",
+        hx_trigger="click",
+        hx_swap="outerHTML",
+    ).render()
+
+
+def test_home_streams_full_page():
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text.strip().startswith("<!DOCTYPE html>")
+    assert response.text.strip().endswith("</html>")
+    assert fastapi_demo._CARDS_HTML in response.text
+    assert fastapi_demo._BUTTONS_HTML in response.text
+
+
+def test_doc_section_escapes_code_but_not_preview():
+    section = fastapi_demo.doc_section("T", "D", "<b>preview</b>", 'f("<x>")')
+    assert "<b>preview</b>" in section
+    assert "f(&#34;&lt;x&gt;&#34;)" in section
@@ -0,0 +1,44 @@
+import pytest
+
+from pysty.text import Text
+
+
+class Labelled(Text):
+    def html_attributes(self) -> dict:
+        return {
+            "class": self.classes,
+            "aria_label": "greeting",
+            "data_role": "note",
+            "hidden": True,
+            "disabled": False,
+            "title": None,
+        }
+
+
+def test_render_escapes_value():
+    assert Text(value='<b>"hi" & bye</b>').render() == (
+        '<p class="text-gray-600">&lt;b&gt;&quot;hi&quot; &amp; bye&lt;/b&gt;</p>'
+    )
+
+
+def test_render_matches_render_dom(structure):
+    text = Text(value="a < b", hx_get="/x")
+    assert structure(text.render()) == structure(text.render_dom())
+
+
+def test_render_normalizes_attributes_like_render_dom(structure):
+    text = Labelled(value="hi")
+    assert structure(text.render()) == structure(text.render_dom())
+    assert text.render() == (
+        '<p class="text-gray-600" aria-label="greeting" data-role="note" '
+        'hidden="hidden">hi</p>'
+    )
+
+
+@pytest.mark.parametrize("name", ["cls", "class_", "className"])
+def test_render_maps_class_aliases(name):
+    class Aliased(Text):
+        def html_attributes(self) -> dict:
+            return {name: "a", "_for": "b"}
+
+    assert Aliased(value="x").render() == '<p class="a" for="b">x</p>'